@@ -1,6 +1,7 @@
 from .arduino import AnalogPins, GPIOPinMode
 from .exceptions import (
-    BoardDisconnectionError, MetadataKeyError, MetadataNotReadyError,
+    BoardDisconnectionError, BoardNACKError,
+    MetadataKeyError, MetadataNotReadyError,
 )
 from .game_specific import GAME_LENGTH
 from .leds import Colour
@@ -18,6 +19,7 @@ __all__ = [
     'AnalogPins',
     'BRAKE',
     'BoardDisconnectionError',
+    'BoardNACKError',
     'COAST',
     'Colour',
     'GAME_LENGTH',
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, IntEnum
 from types import MappingProxyType
 
 from serial.tools.list_ports import comports
 
-from .exceptions import BoardDisconnectionError, IncorrectBoardError
+from .exceptions import (
+    BoardDisconnectionError, BoardNACKError, IncorrectBoardError,
+)
 from .logging import log_to_debug
 from .serial_wrapper import SerialWrapper
 from .utils import (
@@ -142,25 +145,31 @@ class Arduino(Board):
             return cls._get_simulator_boards()
 
         boards = {}
-        serial_ports = comports()
-        for port in serial_ports:
-            if (port.vid, port.pid) in SUPPORTED_VID_PIDS:
-                # Create board identity from USB port info
-                initial_identity = get_USB_identity(port)
-
-                try:
-                    board = Arduino(port.device, initial_identity)
-                except BoardDisconnectionError:
-                    logger.warning(
-                        f"Found Arduino-like serial port at {port.device!r}, "
-                        "but it could not be identified. Ignoring this device")
-                    continue
-                except IncorrectBoardError as err:
-                    logger.warning(
-                        f"Board returned type {err.returned_type!r}, "
-                        f"expected {err.expected_type!r}. Ignoring this device")
-                    continue
-                boards[board._identity.asset_tag] = board
+        serial_ports = [
+            port for port in comports()
+            if (port.vid, port.pid) in SUPPORTED_VID_PIDS
+        ]
+        # Each board is identified in parallel, as opening the port and waiting
+        # for the board to respond does not depend on the other boards
+        with ThreadPoolExecutor(max_workers=max(1, len(serial_ports))) as executor:
+            pending_boards = [
+                (port, executor.submit(Arduino, port.device, get_USB_identity(port)))
+                for port in serial_ports
+            ]
+        for port, pending_board in pending_boards:
+            try:
+                board = pending_board.result()
+            except BoardDisconnectionError:
+                logger.warning(
+                    f"Found Arduino-like serial port at {port.device!r}, "
+                    "but it could not be identified. Ignoring this device")
+                continue
+            except IncorrectBoardError as err:
+                logger.warning(
+                    f"Board returned type {err.returned_type!r}, "
+                    f"expected {err.expected_type!r}. Ignoring this device")
+                continue
+            boards[board._identity.asset_tag] = board
 
         # Add any manually specified boards
         if isinstance(manual_boards, list):
@@ -333,9 +342,10 @@ class Pin:
                 self._serial.write(f'PIN:{self._index}:DIGITAL:SET:1')
             else:
                 self._serial.write(f'PIN:{self._index}:DIGITAL:SET:0')
-        except RuntimeError as e:
+        except BoardNACKError as e:
             if 'is not supported in' in str(e):
                 raise IOError(str(e))
+            raise
 
     @property
     @log_to_debug
@@ -357,10 +367,11 @@ class Pin:
             raise IOError('Pin does not support analog read')
         try:
             response = self._serial.query(f'PIN:{self._index}:ANALOG:GET?')
-        except RuntimeError as e:
+        except BoardNACKError as e:
             # The firmware returns a NACK if the pin is not in INPUT mode
             if 'is not supported in' in str(e):
                 raise IOError(str(e))
+            raise
         # map the response from the ADC range to the voltage range
         return map_to_float(int(response), ADC_MIN, ADC_MAX, 0.0, 5.0)
 
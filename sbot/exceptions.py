@@ -30,6 +30,15 @@ class BoardDisconnectionError(IOError):
     pass
 
 
+class BoardNACKError(RuntimeError):
+    """
+    Raised when a board rejects a command with a NACK response.
+
+    The message is the error message returned by the board's firmware.
+    """
+    pass
+
+
 class IncorrectBoardError(IOError):
     """
     Raised when a board returns the wrong board type in response to *IDN?.
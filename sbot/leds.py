@@ -212,6 +212,7 @@ class LedServer(Board):
 
     Used when running in the simulator to control the simulated LEDs.
     """
+    __slots__ = ('_serial', '_identity')
 
     @staticmethod
     def get_board_type() -> str:
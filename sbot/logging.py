@@ -59,7 +59,8 @@ def log_to_debug(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
     """
     Wrap a function to log its arguments and return value at DEBUG level.
 
-    Logging is to the function's module logger.
+    Logging is to the function's module logger. When debug logging is disabled,
+    the function is called directly without formatting its arguments.
 
     :param func: A function to wrap in debug logging
     :return: The wrapped function
@@ -68,6 +69,10 @@ def log_to_debug(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
 
     @functools.wraps(func)
     def wrapper_debug(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
+        if not logger.isEnabledFor(logging.DEBUG):
+            # Skip building the argument reprs when they won't be logged
+            return func(*args, **kwargs)
+
         args_repr = [repr(a) for a in args]
         kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
         signature = ", ".join(args_repr + kwargs_repr)
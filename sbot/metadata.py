@@ -21,7 +21,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import TypedDict
+from typing import NamedTuple, TypedDict
 
 from .exceptions import MetadataKeyError
 
@@ -45,6 +45,27 @@ class Metadata(TypedDict):
     zone: int
 
 
+class MetadataSnapshot(NamedTuple):
+    """
+    An immutable copy of the metadata fields, used for fast attribute access.
+
+    :param is_competition: Whether the robot is in competition mode
+    :param zone: The zone that the robot is in
+    """
+    is_competition: bool
+    zone: int
+
+    @classmethod
+    def from_metadata(cls, metadata: Metadata) -> MetadataSnapshot:
+        """
+        Create a snapshot of the required fields of a metadata dictionary.
+
+        :param metadata: The loaded metadata dictionary
+        :return: The metadata snapshot
+        """
+        return cls(is_competition=metadata['is_competition'], zone=metadata['zone'])
+
+
 # The default metadata to use if no file is found
 DEFAULT_METADATA: Metadata = {
     "is_competition": False,
@@ -74,7 +95,7 @@ def load() -> Metadata:
                 elif item.name == METADATA_NAME:
                     return _load_metadata(item)
             except PermissionError:
-                logger.debug(f"Unable to read {item}")
+                logger.debug("Unable to read %s", item)
         else:
             logger.info(f"No JSON metadata files found in {search_path}")
     else:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import atexit
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from types import MappingProxyType
 from typing import NamedTuple
@@ -14,11 +15,13 @@ from .logging import log_to_debug
 from .serial_wrapper import SerialWrapper
 from .utils import (
     IN_SIMULATOR, Board, BoardIdentity, float_bounds_check,
-    get_simulator_boards, get_USB_identity, map_to_float, map_to_int,
+    get_simulator_boards, get_USB_identity,
 )
 
 logger = logging.getLogger(__name__)
 BAUDRATE = 115200
+# The firmware represents powers of -1.0 to 1.0 as integers from -1000 to 1000
+POWER_SCALE = 1000
 
 
 class MotorPower(IntEnum):
@@ -141,27 +144,33 @@ class MotorBoard(Board):
             return cls._get_simulator_boards()
 
         boards = {}
-        serial_ports = comports()
-        for port in serial_ports:
-            # Filter to USB vendor and product ID of the FTDI FT232R
-            # chip used on the motor board
-            if port.vid == 0x0403 and port.pid == 0x6001:
-                # Create board identity from USB port info
-                initial_identity = get_USB_identity(port)
-
-                try:
-                    board = MotorBoard(port.device, initial_identity)
-                except BoardDisconnectionError:
-                    logger.warning(
-                        f"Found motor board-like serial port at {port.device!r}, "
-                        "but it could not be identified. Ignoring this device")
-                    continue
-                except IncorrectBoardError as err:
-                    logger.warning(
-                        f"Board returned type {err.returned_type!r}, "
-                        f"expected {err.expected_type!r}. Ignoring this device")
-                    continue
-                boards[board._identity.asset_tag] = board
+        # Filter to USB vendor and product ID of the FTDI FT232R
+        # chip used on the motor board
+        serial_ports = [
+            port for port in comports()
+            if port.vid == 0x0403 and port.pid == 0x6001
+        ]
+        # Each board is identified in parallel, as opening the port and waiting
+        # for the board to respond does not depend on the other boards
+        with ThreadPoolExecutor(max_workers=max(1, len(serial_ports))) as executor:
+            pending_boards = [
+                (port, executor.submit(MotorBoard, port.device, get_USB_identity(port)))
+                for port in serial_ports
+            ]
+        for port, pending_board in pending_boards:
+            try:
+                board = pending_board.result()
+            except BoardDisconnectionError:
+                logger.warning(
+                    f"Found motor board-like serial port at {port.device!r}, "
+                    "but it could not be identified. Ignoring this device")
+                continue
+            except IncorrectBoardError as err:
+                logger.warning(
+                    f"Board returned type {err.returned_type!r}, "
+                    f"expected {err.expected_type!r}. Ignoring this device")
+                continue
+            boards[board._identity.asset_tag] = board
 
         # Add any manually specified boards
         if isinstance(manual_boards, list):
@@ -197,6 +206,19 @@ class MotorBoard(Board):
         """
         return self._motors
 
+    @log_to_debug
+    def get_currents(self) -> tuple[float, float]:
+        """
+        Read the current draw of both motors at once.
+
+        The queries are sent to the board together, which is faster than
+        reading the current of each motor in turn.
+
+        :return: The current draw of each motor in amps, in order of the motor index.
+        """
+        current_0, current_1 = self._serial.query_multi(['MOT:0:I?', 'MOT:1:I?'])
+        return float(current_0) / 1000, float(current_1) / 1000
+
     @log_to_debug
     def identify(self) -> BoardIdentity:
         """
@@ -275,7 +297,7 @@ class Motor:
 
         if not enabled:
             return MotorPower.COAST
-        return map_to_float(value, -1000, 1000, -1.0, 1.0, precision=3)
+        return round(value / POWER_SCALE, 3)
 
     @power.setter
     @log_to_debug
@@ -296,7 +318,8 @@ class Motor:
             value, -1.0, 1.0,
             'Motor power is a float between -1.0 and 1.0')
 
-        setpoint = map_to_int(value, -1.0, 1.0, -1000, 1000)
+        # The range is symmetric about zero, so the mapping is a single scale
+        setpoint = int(value * POWER_SCALE)
         self._serial.write(f'MOT:{self._index}:SET:{setpoint}')
 
     @property
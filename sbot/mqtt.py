@@ -103,7 +103,7 @@ class MQTTClient:
         topic: str,
         callback: Callable[[mqtt.Client, Any, mqtt.MQTTMessage], None],
     ) -> None:
-        LOGGER.debug(f"Subscribing to {topic}")
+        LOGGER.debug("Subscribing to %s", topic)
         self._client.message_callback_add(topic, callback)
         self._client.subscribe(topic, qos=1)
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from socket import socket
 from time import sleep
 from types import MappingProxyType
@@ -15,12 +16,15 @@ from .camera import AprilCamera, _setup_cameras
 from .exceptions import MetadataNotReadyError
 from .leds import LED, StartLed, get_user_leds
 from .logging import log_to_debug, setup_logging
-from .metadata import Metadata
+from .metadata import Metadata, MetadataSnapshot
 from .motor_board import MotorBoard
 from .power_board import Note, PowerBoard
 from .servo_board import ServoBoard
 from .simulator.time_server import TimeServer
-from .utils import IN_SIMULATOR, ensure_atexit_on_term, obtain_lock, singular
+from .utils import (
+    IN_SIMULATOR, Board, BoardIdentity,
+    ensure_atexit_on_term, obtain_lock, singular,
+)
 
 try:
     from .mqtt import (
@@ -48,8 +52,8 @@ class Robot:
     :param no_powerboard: If True, initialize the robot without a powerboard, defaults to False
     """
     __slots__ = (
-        '_lock', '_metadata', '_power_board', '_motor_boards', '_servo_boards',
-        '_arduinos', '_cameras', '_mqttc', '_start_button', '_time_server', '_user_leds',
+        '_lock', '_metadata', '_metadata_snapshot', '_power_board', '_motor_boards',
+        '_servo_boards', '_arduinos', '_cameras', '_mqttc', '_start_button', '_user_leds',
         '_start_led', '_no_pb',
     )
 
@@ -72,6 +76,7 @@ class Robot:
         else:
             self._lock = obtain_lock()
         self._metadata: Metadata | None = None
+        self._metadata_snapshot: MetadataSnapshot | None = None
         self._no_pb = no_powerboard
 
         setup_logging(debug, trace_logging)
@@ -116,7 +121,8 @@ class Robot:
 
         All boards are located automatically, but additional serial ports can be
         provided using the manual_boards parameter. Located boards are queried for
-        their identity and firmware version.
+        their identity and firmware version, which opens their serial ports.
+        Each type of board is located concurrently.
 
         :param manual_boards:  A dictionary of board types to a list of additional
             serial port paths that should be checked for boards of that type, defaults to None
@@ -128,9 +134,18 @@ class Robot:
         manual_servoboards = manual_boards.get(ServoBoard.get_board_type(), [])
         manual_arduinos = manual_boards.get(Arduino.get_board_type(), [])
 
-        self._motor_boards = MotorBoard._get_supported_boards(manual_motorboards)
-        self._servo_boards = ServoBoard._get_supported_boards(manual_servoboards)
-        self._arduinos = Arduino._get_supported_boards(manual_arduinos)
+        # Each type of board is discovered in parallel, so the time spent opening ports
+        # and waiting for boards that reset on connection, like the Arduino, overlaps
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            motor_boards = executor.submit(
+                MotorBoard._get_supported_boards, manual_motorboards)
+            servo_boards = executor.submit(
+                ServoBoard._get_supported_boards, manual_servoboards)
+            arduinos = executor.submit(Arduino._get_supported_boards, manual_arduinos)
+
+        self._motor_boards = motor_boards.result()
+        self._servo_boards = servo_boards.result()
+        self._arduinos = arduinos.result()
 
         self._user_leds = get_user_leds()
         self._start_led = StartLed()
@@ -155,23 +170,31 @@ class Robot:
         Log the board types and serial numbers of all the boards connected to the robot.
 
         Firmware versions are also logged at debug level.
+        This is skipped if info level logging is disabled.
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         # we only have one power board so make it iterable
-        power_board = [] if self._no_pb else [self.power_board]
-        boards = itertools.chain(
+        power_board = [] if self._no_pb else [self._power_board]
+        serial_boards = itertools.chain(
             power_board,
-            self.motor_boards.values(),
-            self.servo_boards.values(),
-            self.arduinos.values(),
-            self._cameras.values(),
+            self._motor_boards.values(),
+            self._servo_boards.values(),
+            self._arduinos.values(),
+        )
+        # The identities of the serial boards were read when they were discovered,
+        # so the boards are not queried again
+        identities: itertools.chain[tuple[Board, BoardIdentity]] = itertools.chain(
+            ((board, board._identity) for board in serial_boards),
+            ((camera, camera.identify()) for camera in self._cameras.values()),
         )
-        for board in boards:
-            identity = board.identify()
-            board_type = board.__class__.__name__
-            logger.info(f"Found {board_type}, serial: {identity.asset_tag}")
+        for board, identity in identities:
+            # Use lazy formatting so disabled log levels don't build the strings
+            logger.info("Found %s, serial: %s", board.__class__.__name__, identity.asset_tag)
             logger.debug(
-                f"Firmware Version of {identity.asset_tag}: {identity.sw_version}, "
-                f"reported type: {identity.board_type}",
+                "Firmware Version of %s: %s, reported type: %s",
+                identity.asset_tag, identity.sw_version, identity.board_type,
             )
 
     @property
@@ -317,7 +340,9 @@ class Robot:
         :return: The robot's zone number
         :raises MetadataNotReadyError: If the start button has not been pressed yet
         """
-        return self.metadata['zone']
+        if self._metadata_snapshot is None:
+            raise MetadataNotReadyError()
+        return self._metadata_snapshot.zone
 
     @property
     @log_to_debug
@@ -328,7 +353,9 @@ class Robot:
         :return: Whether the robot is in competition mode
         :raises MetadataNotReadyError: If the start button has not been pressed yet
         """
-        return self.metadata['is_competition']
+        if self._metadata_snapshot is None:
+            raise MetadataNotReadyError()
+        return self._metadata_snapshot.is_competition
 
     @log_to_debug
     def wait_start(self) -> None:
@@ -349,7 +376,7 @@ class Robot:
             remote_start_pressed = null_button_pressed
 
         if not self._no_pb:
-            start_button_pressed = self.power_board._start_button
+            start_button_pressed = self._power_board._start_button
         else:
             # null out the start button function
             start_button_pressed = null_button_pressed
@@ -360,8 +387,8 @@ class Robot:
         logger.info('Waiting for start button.')
 
         if not self._no_pb:
-            self.power_board.piezo.buzz(Note.A6, 0.1)
-            self.power_board._run_led.flash()
+            self._power_board.piezo.buzz(Note.A6, 0.1)
+            self._power_board._run_led.flash()
         self._start_led.flash_start()
 
         while not start_button_pressed() and not remote_start_pressed():
@@ -369,11 +396,12 @@ class Robot:
         logger.info("Start button pressed.")
 
         if not self._no_pb:
-            self.power_board._run_led.on()
+            self._power_board._run_led.on()
         self._start_led.set_state(False)
 
         if self._metadata is None:
             self._metadata = metadata.load()
+            self._metadata_snapshot = MetadataSnapshot.from_metadata(self._metadata)
 
         # Simulator timeout is handled by the simulator supervisor
         if self.is_competition and not IN_SIMULATOR:
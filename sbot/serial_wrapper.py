@@ -7,15 +7,20 @@ and for handling port timeouts and disconnections.
 from __future__ import annotations
 
 import logging
+import os
+import random
+import select
+import socket
 import sys
 import threading
 import time
-from functools import wraps
-from typing import Callable, TypeVar
+from functools import lru_cache, wraps
+from typing import Callable, Sequence, TypeVar
 
 import serial
+from serial.urlhandler import protocol_socket
 
-from .exceptions import BoardDisconnectionError
+from .exceptions import BoardDisconnectionError, BoardNACKError
 from .logging import TRACE
 from .utils import IN_SIMULATOR, BoardIdentity
 
@@ -36,6 +41,24 @@ if IN_SIMULATOR:
 else:
     BASE_TIMEOUT = 0.5
 
+# Prefix of the response a board returns when a command fails
+NACK_PREFIX = 'NACK'
+
+# Bounds of the exponential backoff between retries, in seconds.
+# Three retries wait 1.75s on average, giving a board time to reconnect
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 2.0
+
+
+def _retry_delay(attempt: int) -> float:
+    """
+    Calculate how long to wait before retrying after a failed attempt.
+
+    :param attempt: The number of the attempt that failed, starting from 0.
+    :return: The delay in seconds.
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
 
 def retry(
     times: int, exceptions: type[E] | tuple[type[E], ...]
@@ -44,6 +67,9 @@ def retry(
     Decorator to retry a function a number of times on a given exception.
     If the function fails on the last attempt the exception is raised.
 
+    Retries are delayed by a random time with an exponentially increasing limit,
+    so boards that fail together, such as when a USB hub resets, don't all retry at once.
+
     This outer function is used to pass arguments to the decorator.
 
     :param times: The number of times to retry the function.
@@ -60,6 +86,10 @@ def retry(
         :param func: The function to decorate.
         :return: The decorated function.
         """
+        if times <= 0:
+            # Without retries the wrapper would only add overhead to each call
+            return func
+
         @wraps(func)
         def retryfn(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
             """
@@ -69,18 +99,34 @@ def retry(
 
             :return: The return value of the original function.
             """
-            attempt = 0
-            while attempt < times:
+            for attempt in range(times):
                 try:
                     return func(*args, **kwargs)
                 except exceptions:
-                    time.sleep(attempt * 0.5)
-                    attempt += 1
+                    time.sleep(_retry_delay(attempt))
+            # The final attempt lets the exception propagate
             return func(*args, **kwargs)
         return retryfn
     return decorator
 
 
+@lru_cache(maxsize=4096)
+def _encode_command(data: str) -> bytes:
+    """
+    Encode a command to be sent to a board, including the terminating newline.
+
+    Boards use a small set of commands, so the encoded commands are cached.
+
+    :param data: The command to encode.
+    :raises ValueError: If the command contains a newline.
+    :return: The encoded command.
+    """
+    if '\n' in data:
+        # The board would see this as multiple commands
+        raise ValueError(f'Command contains a newline: {data!r}')
+    return data.encode() + b'\n'
+
+
 class SerialWrapper:
     def __init__(
         self,
@@ -89,6 +135,7 @@ class SerialWrapper:
         timeout: float | None = BASE_TIMEOUT,
         identity: BoardIdentity = BoardIdentity(),
         delay_after_connect: float = 0,
+        max_response_len: int = 256,
     ):
         # Mutex serial port access to allow for multiple threads to use the same serial port
         self._lock = threading.Lock()
@@ -97,20 +144,39 @@ class SerialWrapper:
         # Time to wait before sending data after connecting to a board
         self.delay_after_connect = delay_after_connect
 
+        # The longest response expected from the board, including the newline
+        self.max_response_len = max_response_len
+        # Responses are read into this buffer, which is reused for every response
+        self._response_buf = bytearray(max_response_len)
+
         # pyserial serial port, the port will be opened on the first message
+        # and then held open for the lifetime of the wrapper.
+        # The port is locked exclusively so no other process can interleave with our commands
         self.serial = serial.serial_for_url(
             port,
             baudrate=baud,
             timeout=timeout,
             write_timeout=timeout,
+            exclusive=True,
             do_not_open=True,
         )
 
+        # The file descriptor of the open port, if it can be accessed directly
+        self._fd: int | None = None
+        # The time.monotonic time the board will be ready to receive data after connecting,
+        # zero once the board is ready
+        self._ready_at = 0.0
+        # The number of times the serial port has been opened, this changes when
+        # the board may have been reset and lost its state
+        self.connection_count = 0
+
     def start(self) -> None:
         """
         Helper method to open the serial port.
 
         This is not usually needed as the port will be opened on the first message.
+        This does not wait for delay_after_connect, the first message waits
+        for any of the delay that remains.
         """
         self._connect()
 
@@ -133,68 +199,265 @@ class SerialWrapper:
         :param data: The data to write to the board.
         :raises BoardDisconnectionError: If the serial connection fails during the transaction,
             including failing to respond to the command.
+        :raises ValueError: If the data contains a newline.
         :return: The response from the board with the trailing newline removed.
         """
+        # The response is processed after releasing the lock
+        # so other threads can use the serial port in the meantime
+        return self._decode_response(self._transact(data))
+
+    def _transact(self, data: str) -> bytes:
+        """
+        Send a command to the board and read the raw response.
+
+        :param data: The data to write to the board.
+        :raises BoardDisconnectionError: If the serial connection fails during the transaction,
+            including failing to respond to the command.
+        :raises ValueError: If the data contains a newline.
+        :return: The undecoded response from the board with the trailing newline removed.
+        """
         with self._lock:
-            if not self.serial.is_open:
-                if not self._connect():
-                    # If the serial port cannot be opened raise an error,
-                    # this will be caught by the retry decorator
-                    raise BoardDisconnectionError((
-                        f'Connection to board {self.identity.board_type}:'
-                        f'{self.identity.asset_tag} could not be established',
-                    ))
+            self._ensure_ready()
 
             try:
-                logger.log(TRACE, f'Serial write - {data!r}')
-                cmd = data + '\n'
-                self.serial.write(cmd.encode())
+                # Lazy formatting avoids the repr when trace logging is disabled
+                logger.log(TRACE, 'Serial write - %r', data)
+                self._write(_encode_command(data))
+
+                response = self._readline()
+            except OSError:
+                # Serial connection failed, close the port and raise an error.
+                # This also catches OSErrors from the port's ioctls if the device is removed,
+                # serial.SerialException is a subclass of OSError
+                self._disconnect()
+                raise BoardDisconnectionError(
+                    f'Board {self._board_name} disconnected during transaction')
+        return response
 
-                response = self.serial.readline()
-                try:
-                    response_str = response.decode().rstrip('\n')
-                except UnicodeDecodeError as e:
+    @retry(times=3, exceptions=(BoardDisconnectionError, UnicodeDecodeError))
+    def query_multi(self, commands: Sequence[str]) -> list[str]:
+        """
+        Send several commands to the board and wait for all of their responses.
+
+        All the commands are written at once, before any of the responses are read,
+        so the board processes them back-to-back rather than waiting for a round
+        trip per command. The whole transaction is retried on serial errors,
+        so the commands should be safe to repeat.
+
+        :param commands: The commands to send to the board.
+        :raises BoardDisconnectionError: If the serial connection fails during the transaction,
+            including failing to respond to the commands.
+        :raises BoardNACKError: If the board returns a NACK response to any command,
+            all the responses are read before this is raised.
+        :raises ValueError: If a command contains a newline.
+        :return: The responses from the board, in the same order as the commands.
+        """
+        if not commands:
+            return []
+        encoded = b''.join(_encode_command(command) for command in commands)
+
+        with self._lock:
+            self._ensure_ready()
+
+            try:
+                if logger.isEnabledFor(TRACE):
+                    for command in commands:
+                        logger.log(TRACE, 'Serial write - %r', command)
+                self._write(encoded)
+
+                responses = self._readlines(len(commands))
+            except OSError:
+                self._disconnect()
+                raise BoardDisconnectionError(
+                    f'Board {self._board_name} disconnected during transaction')
+
+        return [self._decode_response(response) for response in responses]
+
+    def _decode_response(self, response: bytes) -> str:
+        """
+        Decode a response from the board and check whether the command failed.
+
+        :param response: The response from the board with the trailing newline removed.
+        :raises UnicodeDecodeError: If the response is not valid UTF-8.
+        :raises BoardNACKError: If the board returned a NACK response,
+            the firmware's error message is raised.
+        :return: The decoded response.
+        """
+        try:
+            response_str = response.decode()
+        except UnicodeDecodeError as e:
+            logger.warning(
+                f"Board {self._board_name} returned invalid characters: {response!r}")
+            raise e
+        logger.log(TRACE, 'Serial read  - %r', response_str)
+
+        if response_str.startswith(NACK_PREFIX):
+            # The message follows a colon, a bare NACK has an empty message
+            _, _, error_msg = response_str.partition(':')
+            logger.error(
+                f'Board {self._board_name} returned NACK on write command: {error_msg}')
+            raise BoardNACKError(error_msg)
+
+        return response_str
+
+    def _write(self, data: bytes) -> None:
+        """
+        Write data to the serial port.
+
+        If the port's file descriptor is available, the data is written directly
+        to it, skipping pyserial's write handling. pyserial is used to write any
+        data that could not be written immediately, so the write timeout is still applied.
+
+        :param data: The data to write.
+        """
+        if self._fd is not None:
+            try:
+                written = os.write(self._fd, data)
+            except BlockingIOError:
+                # The OS buffer is full
+                written = 0
+            if written == len(data):
+                return
+            data = data[written:]
+        self.serial.write(data)
+
+    def _read_into(self, buf: memoryview, deadline: float | None) -> int:
+        """
+        Read the data waiting on the serial port, waiting until the deadline for data.
+
+        If the port's file descriptor is available, it is read directly into the buffer,
+        skipping pyserial's read handling. Otherwise, pyserial waits for up to the
+        port's timeout if the deadline has not passed, as changing the timeout
+        reconfigures the port.
+
+        :param buf: The buffer to read the data into, at most its length is read.
+        :param deadline: The time.monotonic time to stop waiting for data at,
+            None to wait indefinitely.
+        :raises serial.SerialException: If the port is readable but returns no data,
+            this happens when the device has been disconnected.
+        :return: The number of bytes read, this is zero if the read timed out.
+        """
+        if self._fd is None:
+            waiting = self.serial.in_waiting
+            if not waiting and deadline is not None and time.monotonic() >= deadline:
+                return 0
+            chunk = self.serial.read(min(max(1, waiting), len(buf)))
+            buf[:len(chunk)] = chunk
+            return len(chunk)
+
+        if deadline is None:
+            timeout = None
+        else:
+            timeout = max(0.0, deadline - time.monotonic())
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return 0
+        size = os.readv(self._fd, [buf])
+        if not size:
+            raise serial.SerialException(
+                'Device reports readiness to read but returned no data')
+        return size
+
+    def _readline(self) -> bytes:
+        """
+        Read a single newline-terminated response from the serial port.
+
+        :raises serial.SerialException: If the read times out before a newline is received
+            or the response is longer than max_response_len.
+        :return: The response with the trailing newline removed.
+        """
+        return self._readlines(1)[0]
+
+    def _readlines(self, count: int) -> list[bytes]:
+        """
+        Read a number of newline-terminated responses from the serial port.
+
+        Unlike pyserial's readline, which reads one byte per call, this reads
+        all the data waiting in the OS buffer at once into a buffer that is
+        reused between responses.
+
+        The timeout applies to the whole read, so a board that sends a response slowly
+        cannot hold the read open for longer than the timeout.
+
+        :param count: The number of responses to read.
+        :raises serial.SerialException: If the read times out before all the responses
+            are received or a response is longer than max_response_len.
+        :return: The responses with the trailing newlines removed.
+        """
+        timeout = self.serial.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        buf = self._response_buf
+        responses = []
+        length = 0
+        # The position to start searching for the end of the line from
+        search_start = 0
+        with memoryview(buf) as view:
+            while True:
+                newline = buf.find(b'\n', search_start, length)
+                if newline != -1:
+                    responses.append(bytes(view[:newline]))
+                    if len(responses) == count:
+                        # This protocol has only one response per command,
+                        # so any data after the last response is stale and is discarded
+                        return responses
+                    # Move the start of the next response to the start of the buffer
+                    remaining = length - (newline + 1)
+                    # The data is copied first as the source and destination can overlap
+                    buf[:remaining] = bytes(view[newline + 1:length])
+                    length = remaining
+                    search_start = 0
+                    continue
+
+                if length >= len(buf):
                     logger.warning(
-                        f"Board {self.identity.board_type}:{self.identity.asset_tag} "
-                        f"returned invalid characters: {response!r}")
-                    raise e
-                logger.log(
-                    TRACE, f'Serial read  - {response_str!r}')
-
-                if b'\n' not in response:
-                    # If readline times out no error is raised, it returns an incomplete string
+                        f'Board {self._board_name} response exceeded {len(buf)} bytes')
+                    raise serial.SerialException('Response too long')
+
+                size = self._read_into(view[length:], deadline)
+                if not size:
+                    # If the read times out no error is raised, it returns an incomplete string
+                    logger.log(
+                        TRACE, 'Serial read  - %r', buf[:length].decode(errors='replace'))
                     logger.warning((
-                        f'Connection to board {self.identity.board_type}:'
-                        f'{self.identity.asset_tag} timed out waiting for response'
+                        f'Connection to board {self._board_name} '
+                        'timed out waiting for response'
                     ))
                     raise serial.SerialException('Timeout on readline')
-            except serial.SerialException:
-                # Serial connection failed, close the port and raise an error
-                self._disconnect()
-                raise BoardDisconnectionError((
-                    f'Board {self.identity.board_type}:{self.identity.asset_tag} '
-                    'disconnected during transaction'
-                ))
-
-            if response_str.startswith('NACK'):
-                _, error_msg = response_str.split(':', maxsplit=1)
-                logger.error((
-                    f'Board {self.identity.board_type}:{self.identity.asset_tag} '
-                    f'returned NACK on write command: {error_msg}'
-                ))
-                raise RuntimeError(error_msg)
-
-            return response_str
+                # Only search the new data for the end of the line
+                search_start = length
+                length += size
 
+    @retry(times=3, exceptions=(BoardDisconnectionError, UnicodeDecodeError))
     def write(self, data: str) -> None:
         """
         Send a command to the board that does not require a response.
 
         :param data: The data to write to the board.
-        :raises RuntimeError: If the board returns a NACK response,
+        :raises BoardDisconnectionError: If the serial connection fails during the transaction,
+            including failing to respond to the command.
+        :raises BoardNACKError: If the board returns a NACK response,
             the firmware's error message is raised.
         """
-        _ = self.query(data)
+        self._decode_response(self._transact(data))
+
+    def _ensure_ready(self) -> None:
+        """
+        Open the serial port if needed and wait for the board to be ready to receive data.
+
+        :raises BoardDisconnectionError: If the serial port cannot be opened.
+        """
+        if not self.serial.is_open:
+            if not self._connect():
+                # If the serial port cannot be opened raise an error,
+                # this will be caught by the retry decorator
+                raise BoardDisconnectionError(
+                    f'Connection to board {self._board_name} could not be established')
+
+        if self._ready_at:
+            remaining = self._ready_at - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            self._ready_at = 0.0
 
     def _connect(self) -> bool:
         """
@@ -208,22 +471,59 @@ class SerialWrapper:
         """
         try:
             self.serial.open()
-            if not IN_SIMULATOR:
-                # Wait for the board to be ready to receive data
-                # Certain boards will reset when the serial port is opened
-                time.sleep(self.delay_after_connect)
-        except serial.SerialException:
-            logger.error((
-                'Failed to connect to board '
-                f'{self.identity.board_type}:{self.identity.asset_tag}'
-            ))
+            try:
+                self._enable_low_latency()
+                if os.name == 'posix' and isinstance(self.serial, serial.Serial):
+                    self._fd = self.serial.fileno()
+            except BaseException:
+                # Don't leave a partially set up port open
+                self._fd = None
+                self.serial.close()
+                raise
+        except OSError:
+            # serial.SerialException is a subclass of OSError
+            logger.error(f'Failed to connect to board {self._board_name}')
             return False
 
-        logger.info(
-            f'Connected to board {self.identity.board_type}:{self.identity.asset_tag}'
-        )
+        if not IN_SIMULATOR:
+            # Certain boards will reset when the serial port is opened,
+            # so commands are delayed until the board is ready to receive data
+            self._ready_at = time.monotonic() + self.delay_after_connect
+
+        self.connection_count += 1
+        logger.info(f'Connected to board {self._board_name}')
         return True
 
+    def _enable_low_latency(self) -> None:
+        """
+        Request low latency mode from the serial port driver.
+
+        USB serial adapters buffer incoming data for several milliseconds before
+        passing it on, this disables that buffering so responses are delivered
+        as soon as they arrive. This is only supported for serial devices on Linux.
+
+        For socket connections, as used by the simulator, Nagle's algorithm is disabled
+        so each command is sent immediately.
+        """
+        if isinstance(self.serial, protocol_socket.Serial):
+            # The duplicated socket shares the connection's socket options
+            with socket.fromfd(
+                self.serial.fileno(), socket.AF_INET, socket.SOCK_STREAM,
+            ) as sock:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return
+
+        if not (sys.platform.startswith('linux') and isinstance(self.serial, serial.Serial)):
+            # Only serial devices on Linux support low latency mode
+            return
+
+        try:
+            self.serial.set_low_latency_mode(True)
+        except (OSError, ValueError):
+            # Not all serial drivers support low latency mode
+            logger.debug(
+                'Unable to enable low latency mode for board %s', self._board_name)
+
     def _disconnect(self) -> None:
         """
         Close the class's serial port.
@@ -231,10 +531,24 @@ class SerialWrapper:
         This is called automatically when the serial connection fails.
         The serial port will be reopened on the next message.
         """
+        self._fd = None
         self.serial.close()
-        logger.warning(
-            f'Board {self.identity.board_type}:{self.identity.asset_tag} disconnected'
-        )
+        logger.warning(f'Board {self._board_name} disconnected')
+
+    @property
+    def identity(self) -> BoardIdentity:
+        """
+        The identity of the board this serial wrapper is connected to.
+
+        :return: The board's identity.
+        """
+        return self._identity
+
+    @identity.setter
+    def identity(self, identity: BoardIdentity) -> None:
+        self._identity = identity
+        # The board's name is included in most log messages, so it is only formatted once
+        self._board_name = f'{identity.board_type}:{identity.asset_tag}'
 
     def set_identity(self, identity: BoardIdentity) -> None:
         """
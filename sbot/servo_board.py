@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import atexit
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from types import MappingProxyType
-from typing import NamedTuple
+from typing import Mapping, NamedTuple
 
 from serial.tools.list_ports import comports
 
@@ -13,7 +14,7 @@ from .logging import log_to_debug
 from .serial_wrapper import SerialWrapper
 from .utils import (
     IN_SIMULATOR, Board, BoardIdentity, float_bounds_check,
-    get_simulator_boards, get_USB_identity, map_to_float, map_to_int,
+    get_simulator_boards, get_USB_identity,
 )
 
 DUTY_MIN = 300
@@ -47,6 +48,13 @@ class ServoStatus(NamedTuple):
         )
 
 
+class ServoTelemetry(NamedTuple):
+    """A named tuple containing the current, voltage and status of the servo board."""
+    current: float
+    voltage: float
+    status: ServoStatus
+
+
 class ServoBoard(Board):
     """
     A class representing the servo board interface.
@@ -138,26 +146,32 @@ class ServoBoard(Board):
             return cls._get_simulator_boards()
 
         boards = {}
-        serial_ports = comports()
-        for port in serial_ports:
-            # Filter to USB vendor and product ID of the SR v4 servo board
-            if port.vid == 0x1BDA and port.pid == 0x0011:
-                # Create board identity from USB port info
-                initial_identity = get_USB_identity(port)
-
-                try:
-                    board = ServoBoard(port.device, initial_identity)
-                except BoardDisconnectionError:
-                    logger.warning(
-                        f"Found servo board-like serial port at {port.device!r}, "
-                        "but it could not be identified. Ignoring this device")
-                    continue
-                except IncorrectBoardError as err:
-                    logger.warning(
-                        f"Board returned type {err.returned_type!r}, "
-                        f"expected {err.expected_type!r}. Ignoring this device")
-                    continue
-                boards[board._identity.asset_tag] = board
+        # Filter to USB vendor and product ID of the SR v4 servo board
+        serial_ports = [
+            port for port in comports()
+            if port.vid == 0x1BDA and port.pid == 0x0011
+        ]
+        # Each board is identified in parallel, as opening the port and waiting
+        # for the board to respond does not depend on the other boards
+        with ThreadPoolExecutor(max_workers=max(1, len(serial_ports))) as executor:
+            pending_boards = [
+                (port, executor.submit(ServoBoard, port.device, get_USB_identity(port)))
+                for port in serial_ports
+            ]
+        for port, pending_board in pending_boards:
+            try:
+                board = pending_board.result()
+            except BoardDisconnectionError:
+                logger.warning(
+                    f"Found servo board-like serial port at {port.device!r}, "
+                    "but it could not be identified. Ignoring this device")
+                continue
+            except IncorrectBoardError as err:
+                logger.warning(
+                    f"Board returned type {err.returned_type!r}, "
+                    f"expected {err.expected_type!r}. Ignoring this device")
+                continue
+            boards[board._identity.asset_tag] = board
 
         # Add any manually specified boards
         if isinstance(manual_boards, list):
@@ -193,6 +207,53 @@ class ServoBoard(Board):
         """
         return self._servos
 
+    @log_to_debug
+    def set_positions(self, positions: Mapping[int, float | None]) -> None:
+        """
+        Set the positions of several servos at once.
+
+        The commands are sent to the board together, which is faster than
+        setting the position of each servo in turn.
+
+        Servos that are already at the requested position are skipped.
+
+        :param positions: A mapping of servo indices to positions, as a float
+            between -1.0 and 1.0 or None to disable the servo.
+        :raises IndexError: If a servo index is not on the board.
+        """
+        changed = []
+        for index, value in positions.items():
+            if not 0 <= index < len(self._servos):
+                # Negative indices would otherwise select servos from the end
+                raise IndexError(f'Servo index {index} is not on the board')
+            servo = self._servos[index]
+            command = servo._position_command(value)
+            if servo._last_command != (command, self._serial.connection_count):
+                changed.append((servo, command))
+
+        for servo, _ in changed:
+            servo._last_command = None
+        self._serial.query_multi([command for _, command in changed])
+        for servo, command in changed:
+            servo._last_command = (command, self._serial.connection_count)
+
+    @log_to_debug
+    def get_positions(self) -> tuple[float | None, ...]:
+        """
+        Get the positions of all the servos on the board at once.
+
+        The commands are sent to the board together, which is faster than
+        getting the position of each servo in turn.
+
+        :return: The position of each servo as a float between -1.0 and 1.0
+            or None if disabled, in order of the servo index.
+        """
+        responses = self._serial.query_multi([servo._get_command for servo in self._servos])
+        return tuple(
+            servo._parse_position(response)
+            for servo, response in zip(self._servos, responses)
+        )
+
     @log_to_debug
     def identify(self) -> BoardIdentity:
         """
@@ -221,6 +282,8 @@ class ServoBoard(Board):
 
         This will disable all servos.
         """
+        for servo in self._servos:
+            servo._last_command = None
         self._serial.write('*RESET')
 
     @property
@@ -247,6 +310,25 @@ class ServoBoard(Board):
         response = self._serial.query('SERVO:V?')
         return float(response) / 1000
 
+    @log_to_debug
+    def telemetry(self) -> ServoTelemetry:
+        """
+        Get the current draw, voltage and status of the board at once.
+
+        The queries are sent to the board together, which is faster than
+        reading each value in turn.
+
+        :return: A named tuple of the current in amps, the voltage in volts
+            and the board's status.
+        """
+        current, voltage, status = self._serial.query_multi(
+            ['SERVO:I?', 'SERVO:V?', '*STATUS?'])
+        return ServoTelemetry(
+            current=float(current) / 1000,
+            voltage=float(voltage) / 1000,
+            status=ServoStatus.from_status_response(status),
+        )
+
     def _cleanup(self) -> None:
         """
         Reset the board and disable all servos on exit.
@@ -269,14 +351,28 @@ class Servo:
     :param serial: The serial wrapper to use to communicate with the board.
     :param index: The index of the servo on the board.
     """
-    __slots__ = ('_serial', '_index', '_duty_min', '_duty_max')
+    __slots__ = (
+        '_serial', '_index', '_duty_min', '_duty_max',
+        '_setpoint_scale', '_setpoint_offset', '_last_command',
+        '_set_prefix', '_get_command', '_disable_command',
+    )
 
     def __init__(self, serial: SerialWrapper, index: int):
         self._serial = serial
         self._index = index
 
-        self._duty_min = START_DUTY_MIN
-        self._duty_max = START_DUTY_MAX
+        # The fixed commands are built once, so the command strings are reused between calls
+        # and their encoded form stays in the serial wrapper's cache
+        self._set_prefix = f'SERVO:{index}:SET:'
+        self._get_command = f'SERVO:{index}:GET?'
+        self._disable_command = f'SERVO:{index}:DISABLE'
+
+        self._set_duty_limits(START_DUTY_MIN, START_DUTY_MAX)
+
+        # The last position command sent and the serial connection it was sent on.
+        # Setting the same position again is skipped, unless the port has been
+        # reopened since, as the board may have been reset.
+        self._last_command: tuple[str, int] | None = None
 
     @log_to_debug
     def set_duty_limits(self, lower: int, upper: int) -> None:
@@ -299,8 +395,23 @@ class Servo:
                 f'Servo pulse limits are ints in µs, in the range {DUTY_MIN} to {DUTY_MAX}'
             )
 
+        self._set_duty_limits(lower, upper)
+
+    def _set_duty_limits(self, lower: int, upper: int) -> None:
+        """
+        Store the pulse on-time limits of the servo.
+
+        The mapping between a position and a pulse on-time is precomputed here,
+        so converting between them only needs a multiply and an add.
+
+        :param lower: The lower limit of the servo pulse in µs.
+        :param upper: The upper limit of the servo pulse in µs.
+        """
         self._duty_min = lower
         self._duty_max = upper
+        # Maps -1.0 to lower and 1.0 to upper
+        self._setpoint_scale = (upper - lower) / 2
+        self._setpoint_offset = (upper + lower) / 2
 
     @log_to_debug
     def get_duty_limits(self) -> tuple[int, int]:
@@ -323,11 +434,7 @@ class Servo:
 
         :return: The position of the servo as a float between -1.0 and 1.0 or None if disabled.
         """
-        response = self._serial.query(f'SERVO:{self._index}:GET?')
-        data = int(response)
-        if data == 0:
-            return None
-        return map_to_float(data, self._duty_min, self._duty_max, -1.0, 1.0, precision=3)
+        return self._parse_position(self._serial.query(self._get_command))
 
     @position.setter
     @log_to_debug
@@ -337,19 +444,55 @@ class Servo:
 
         If the servo is disabled, this will enable it.
         -1.0 to 1.0 may not be the full range of the servo, see set_duty_limits().
+        If the servo is already at this position, no command is sent to the board.
 
         :param value: The position of the servo as a float between -1.0 and 1.0
             or None to disable.
         """
+        command = self._position_command(value)
+        if self._last_command != (command, self._serial.connection_count):
+            self._send_position_command(command)
+
+    def _send_position_command(self, command: str) -> None:
+        """
+        Send a position command to the board and record it as the last command sent.
+
+        :param command: The command to send.
+        """
+        # If the command fails, the state of the servo is unknown
+        self._last_command = None
+        self._serial.write(command)
+        self._last_command = (command, self._serial.connection_count)
+
+    def _position_command(self, value: float | None) -> str:
+        """
+        Generate the command to set the position of the servo.
+
+        :param value: The position of the servo as a float between -1.0 and 1.0
+            or None to disable.
+        :return: The command to send to the board.
+        """
         if value is None:
-            self.disable()
-            return
+            return self._disable_command
         value = float_bounds_check(
             value, -1.0, 1.0,
             'Servo position is a float between -1.0 and 1.0')
 
-        setpoint = map_to_int(value, -1.0, 1.0, self._duty_min, self._duty_max)
-        self._serial.write(f'SERVO:{self._index}:SET:{setpoint}')
+        setpoint = int(value * self._setpoint_scale + self._setpoint_offset)
+        return f'{self._set_prefix}{setpoint}'
+
+    def _parse_position(self, response: str) -> float | None:
+        """
+        Convert the board's response to a position query to the position of the servo.
+
+        :param response: The pulse on-time reported by the board.
+        :return: The position of the servo as a float between -1.0 and 1.0 or None if disabled.
+        """
+        data = int(response)
+        if data == 0:
+            return None
+        # The inverse of the mapping used to set the position
+        return round((data - self._setpoint_offset) / self._setpoint_scale, 3)
 
     @log_to_debug
     def disable(self) -> None:
@@ -358,7 +501,7 @@ class Servo:
 
         This will cause this channel to output a 0% duty cycle.
         """
-        self._serial.write(f'SERVO:{self._index}:DISABLE')
+        self._send_position_command(self._disable_command)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__qualname__} index={self._index} {self._serial}>"
@@ -1,3 +1,5 @@
+import select
+import socket
 import struct
 
 import cv2
@@ -8,7 +10,9 @@ from serial import serial_for_url
 
 from ..utils import BoardInfo
 
-HEADER_SIZE = 5  # 1 byte for the type, 4 bytes for the length
+# 1 byte for the type, 4 bytes for the length
+HEADER = struct.Struct('>BI')
+HEADER_SIZE = HEADER.size
 IMAGE_TAG_ID = 0
 
 
@@ -20,6 +24,12 @@ class WebotsRemoteCameraSource(FrameSource):
         self.calibration = (0.0, 0.0, 0.0, 0.0)
         # Use pyserial to give a nicer interface for connecting to the camera socket
         self._serial = serial_for_url(camera_info.url, baudrate=115200, timeout=None)
+        # Frames are read directly from the socket into the frame's array,
+        # the duplicated socket shares the connection with pyserial
+        self._socket = socket.fromfd(self._serial.fileno(), socket.AF_INET, socket.SOCK_STREAM)
+        # Send each request immediately rather than waiting to combine small writes
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._header_buf = bytearray(HEADER_SIZE)
 
         # Check the camera is connected
         response = self._make_request("*IDN?")
@@ -49,24 +59,42 @@ class WebotsRemoteCameraSource(FrameSource):
         self._serial.write(b"CAM:FRAME!\n")
         # The image is encoded as a TLV (Type, Length, Value) packet
         # so we need to read the header to get the type and length of the image
-        header = self._serial.read(HEADER_SIZE)
-        assert len(header) == HEADER_SIZE, f"Invalid header length: {len(header)}"
-        img_tag, img_len = struct.unpack('>BI', header)
+        self._recv_into(memoryview(self._header_buf))
+        img_tag, img_len = HEADER.unpack(self._header_buf)
         assert img_tag == IMAGE_TAG_ID, f"Invalid image tag: {img_tag}"
 
-        # Get the image data now we know the length
-        img_data = self._serial.read(img_len)
-        assert len(img_data) == img_len, f"Invalid image data length: {len(img_data)}"
-
-        rgb_frame_raw: NDArray[np.uint8] = np.frombuffer(img_data, np.uint8)
-
         # Height is first, then width, then channels
-        return rgb_frame_raw.reshape((self.image_size[1], self.image_size[0], 4))
+        frame: NDArray[np.uint8] = np.empty(
+            (self.image_size[1], self.image_size[0], 4), dtype=np.uint8)
+        assert frame.nbytes == img_len, f"Invalid image data length: {img_len}"
+
+        # Get the image data now we know the length
+        self._recv_into(frame.data.cast('B'))
+        return frame
 
     def close(self) -> None:
         """Close the underlying socket on exit."""
+        self._socket.close()
         self._serial.close()
 
+    def _recv_into(self, buf: memoryview) -> None:
+        """
+        Fill a buffer with data from the socket.
+
+        This avoids the intermediate copies made by pyserial's read.
+
+        :param buf: The buffer to fill.
+        :raises RuntimeError: If the socket is disconnected before the buffer is filled.
+        """
+        received = 0
+        while received < len(buf):
+            # pyserial puts the socket in non-blocking mode, so wait for data to arrive
+            select.select([self._socket], [], [])
+            size = self._socket.recv_into(buf[received:])
+            if not size:
+                raise RuntimeError("Camera socket disconnected")
+            received += size
+
     def _make_request(self, command: str) -> bytes:
         self._serial.write(command.encode() + b"\n")
         response = self._serial.readline()
@@ -13,6 +13,8 @@ BAUDRATE = 115200
 
 
 class TimeServer:
+    __slots__ = ('_serial', '_identity')
+
     @staticmethod
     def get_board_type() -> str:
         """
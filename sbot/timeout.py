@@ -64,7 +64,7 @@ def win_timeout_handler() -> None:
     os.kill(os.getpid(), signal.SIGTERM)
 
 
-def kill_after_delay(timeout_seconds: int) -> None:
+def kill_after_delay(timeout_seconds: float) -> None:
     """
     Kill the robot after a certain amount of time.
 
@@ -81,5 +81,6 @@ def kill_after_delay(timeout_seconds: int) -> None:
         timer.start()
     else:
         signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
-    logger.debug(f"Kill Signal Timeout set: {timeout_seconds}s")
+        # Unlike alarm(), the interval timer supports fractional seconds
+        signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    logger.debug("Kill Signal Timeout set: %ss", timeout_seconds)
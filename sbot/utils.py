@@ -5,6 +5,7 @@ import logging
 import os
 import signal
 import socket
+import weakref
 from abc import ABC, abstractmethod
 from types import FrameType
 from typing import Any, Mapping, NamedTuple, TypeVar
@@ -55,6 +56,7 @@ class Board(ABC):
     They must also be defined in subclasses.
     """
     __slots__ = ('_identity',)
+    _identity: BoardIdentity
 
     @staticmethod
     @abstractmethod
@@ -141,13 +143,18 @@ def singular(container: Mapping[str, T]) -> T:
     length = len(container)
 
     if length == 1:
-        return list(container.values())[0]
+        return next(iter(container.values()))
     elif length == 0:
         raise RuntimeError('No boards of this type found')
     else:
         raise RuntimeError(f'expected only one to be connected, but found {length}')
 
 
+# A weak reference to the most recently obtained robot lock,
+# so the lock is still released when the robot that holds it is deleted
+_current_lock: weakref.ref[socket.socket] | None = None
+
+
 def obtain_lock(lock_port: int = 10653) -> socket.socket:
     """
     Bind to a port to claim it and prevent another process using it.
@@ -167,9 +174,28 @@ def obtain_lock(lock_port: int = 10653) -> socket.socket:
     except OSError:
         raise OSError('Unable to obtain lock, Is another robot instance already running?')
 
+    global _current_lock
+    _current_lock = weakref.ref(lock)
+
     return lock
 
 
+def _close_lock_in_child() -> None:
+    """
+    Close the robot lock in a forked child process.
+
+    Sockets are already closed on exec, this also closes the lock in forked children
+    so a lingering child process can't hold the lock after this process exits.
+    """
+    lock = _current_lock() if _current_lock is not None else None
+    if lock is not None:
+        lock.close()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_close_lock_in_child)
+
+
 def float_bounds_check(value: Any, min_val: float, max_val: float, err_msg: str) -> float:
     """
     Test that a value can be converted to a float and is within the given bounds.
@@ -189,7 +215,8 @@ def float_bounds_check(value: Any, min_val: float, max_val: float, err_msg: str)
     except ValueError as e:
         raise TypeError(err_msg) from e
 
-    if (new_val < min_val) or (new_val > max_val):
+    # A chained comparison also rejects NaN, which fails every comparison
+    if not min_val <= new_val <= max_val:
         raise ValueError(err_msg)
 
     return new_val
@@ -39,6 +39,7 @@ class MockSerialWrapper:
         self.responses = responses
         self.request_index = 0
         self.identity = BoardIdentity()
+        self.connection_count = 1
 
     def _add_responses(self, responses: list[tuple[str, str]]) -> None:
         """Add more responses to the end of the list."""
@@ -51,6 +52,7 @@ class MockSerialWrapper:
         timeout: float = 0.5,
         identity: BoardIdentity = BoardIdentity(),
         delay_after_connect: float = 0,
+        max_response_len: int = 256,
     ) -> 'MockSerialWrapper':
         """This will replace the original init method during the test."""
         self._port = port
@@ -73,6 +75,10 @@ class MockSerialWrapper:
         self.request_index += 1
         return response
 
+    def query_multi(self, requests: list[str]) -> list[str]:
+        """Mocks sending several commands and returning their responses."""
+        return [self.query(request) for request in requests]
+
     def write(self, request: str) -> None:
         """Send a command without waiting for a response."""
         _ = self.query(request)
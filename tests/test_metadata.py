@@ -4,7 +4,9 @@ from pathlib import Path
 
 from pytest import raises
 
-from sbot.metadata import METADATA_ENV_VAR, MetadataKeyError, load
+from sbot.metadata import (
+    METADATA_ENV_VAR, MetadataKeyError, MetadataSnapshot, load,
+)
 
 
 def test_metadata_env_var() -> None:
@@ -87,3 +89,13 @@ def test_missing_metadata_path(monkeypatch) -> None:
 
     with raises(FileNotFoundError):
         load()
+
+
+def test_metadata_snapshot(monkeypatch) -> None:
+    """Test that a snapshot can be taken of the loaded metadata."""
+    data_path = Path(__file__).parent / 'test_data/valid'
+    monkeypatch.setenv(METADATA_ENV_VAR, str(data_path.absolute()))
+
+    snapshot = MetadataSnapshot.from_metadata(load())
+    assert snapshot.zone == 1
+    assert snapshot.is_competition is True
@@ -102,6 +102,7 @@ def test_motor_board_motors(motorboard_serial: MockMotorBoard) -> None:
     serial_wrapper._add_responses([
         ("MOT:0:SET:500", "ACK"),
         ("MOT:1:SET:512", "ACK"),
+        ("MOT:0:SET:-430", "ACK"),
         ("MOT:0:DISABLE", "ACK"),
         ("MOT:1:DISABLE", "ACK"),
         ("MOT:0:SET:0", "ACK"),
@@ -117,6 +118,7 @@ def test_motor_board_motors(motorboard_serial: MockMotorBoard) -> None:
     # Test that we can set the motor power
     motorboard.motors[0].power = 0.5
     motorboard.motors[1].power = 0.5123
+    motorboard.motors[0].power = -0.43
 
     # Test that we can disable the motors
     motorboard.motors[0].power = MotorPower.COAST
@@ -139,6 +141,19 @@ def test_motor_board_motors(motorboard_serial: MockMotorBoard) -> None:
     assert motorboard.motors[1].current == 12.345
 
 
+def test_motor_board_get_currents(motorboard_serial: MockMotorBoard) -> None:
+    """
+    Test that the current of both motors can be read at once.
+    """
+    motorboard = motorboard_serial.motor_board
+    motorboard_serial.serial_wrapper._add_responses([
+        ("MOT:0:I?", "1234"),
+        ("MOT:1:I?", "12345"),
+    ])
+
+    assert motorboard.get_currents() == (1.234, 12.345)
+
+
 def test_motor_board_bounds_check(motorboard_serial: MockMotorBoard) -> None:
     """
     Test that handling of out of bounds values is correct.
@@ -166,6 +181,8 @@ def test_motor_board_bounds_check(motorboard_serial: MockMotorBoard) -> None:
         motorboard.motors[0].power = 1.2
     with pytest.raises(ValueError):
         motorboard.motors[0].power = 100
+    with pytest.raises(ValueError):
+        motorboard.motors[0].power = float('nan')
 
     # Test that we handle invalid power value types correctly
     with pytest.raises(TypeError):
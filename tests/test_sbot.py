@@ -24,7 +24,6 @@ def test_robot(monkeypatch, caplog) -> None:
         ("OUT:3:SET:1", "ACK"),
         ("OUT:5:SET:1", "ACK"),
         ("OUT:6:SET:1", "ACK"),
-        ("*IDN?", "Student Robotics:PBv4B:POW123:4.4.1"),
         ("BTN:START:GET?", "0:1"),
         ("NOTE:1760:100", "ACK"),  # Start up sound
         ("LED:RUN:SET:F", "ACK"),
@@ -34,15 +33,12 @@ def test_robot(monkeypatch, caplog) -> None:
     ]))
     monkeypatch.setattr('sbot.motor_board.SerialWrapper', MockSerialWrapper([
         ("*IDN?", "Student Robotics:MCv4B:MOT123:4.4"),
-        ("*IDN?", "Student Robotics:MCv4B:MOT123:4.4"),
     ]))
     monkeypatch.setattr('sbot.servo_board.SerialWrapper', MockSerialWrapper([
         ("*IDN?", "Student Robotics:SBv4B:TEST123:4.3"),
-        ("*IDN?", "Student Robotics:SBv4B:TEST123:4.3"),
     ]))
     monkeypatch.setattr('sbot.arduino.SerialWrapper', MockSerialWrapper([
         ("*IDN?", "Student Robotics:Arduino:X:2.0"),
-        ("*IDN?", "Student Robotics:Arduino:X:2.0"),
     ]))
 
     # monkey patch atexit to avoid running cleanup code
@@ -100,6 +96,11 @@ def test_robot(monkeypatch, caplog) -> None:
     assert r.arduino._identity == BoardIdentity(
         "Student Robotics", "Arduino", "test://", "2.0")
 
+    # Check the board mappings are immutable and iterate over the boards
+    assert list(r.motor_boards.values()) == [r.motor_board]
+    with pytest.raises(TypeError):
+        r.motor_boards['MOT456'] = r.motor_board  # type: ignore[index]
+
     # Check that a RuntimeError is raised if we have 0 instances of a board
     with pytest.raises(RuntimeError, match="No boards of this type found"):
         r.camera.identify()
@@ -1,8 +1,13 @@
 import logging
+import os
+import socket
+import threading
+import time
 
 import pytest
+from serial import SerialException
 
-from sbot.exceptions import BoardDisconnectionError
+from sbot.exceptions import BoardDisconnectionError, BoardNACKError
 from sbot.serial_wrapper import SerialWrapper, retry
 from sbot.utils import BoardIdentity
 
@@ -62,6 +67,56 @@ def test_retry_single_exception() -> None:
     assert call_count == 2
 
 
+def test_retry_no_retries() -> None:
+    """Test that the retry decorator returns the function unchanged without retries."""
+    def test_func() -> None:
+        """Test function."""
+
+    assert retry(times=0, exceptions=Exception)(test_func) is test_func
+
+
+def test_retry_backoff(monkeypatch) -> None:
+    """Test that the retry delay is randomised with an exponentially increasing limit."""
+    delays = []
+    monkeypatch.setattr('sbot.serial_wrapper.time.sleep', delays.append)
+    monkeypatch.setattr('sbot.serial_wrapper.random.uniform', lambda low, high: high)
+
+    @retry(times=6, exceptions=Exception)
+    def test_func() -> None:
+        """Test function."""
+        raise Exception("Test exception")
+
+    with pytest.raises(Exception):
+        test_func()
+
+    assert delays == [0.5, 1.0, 2.0, 2.0, 2.0, 2.0]
+
+
+def test_retry_backoff_total(monkeypatch) -> None:
+    """Test the total time spent waiting between the retries of a serial command."""
+    delays = []
+    monkeypatch.setattr('sbot.serial_wrapper.time.sleep', delays.append)
+
+    @retry(times=3, exceptions=Exception)
+    def test_func() -> None:
+        """Test function."""
+        raise Exception("Test exception")
+
+    # The longest possible wait
+    monkeypatch.setattr('sbot.serial_wrapper.random.uniform', lambda low, high: high)
+    with pytest.raises(Exception):
+        test_func()
+    assert sum(delays) == pytest.approx(3.5)
+
+    # The average wait
+    delays.clear()
+    monkeypatch.setattr(
+        'sbot.serial_wrapper.random.uniform', lambda low, high: (low + high) / 2)
+    with pytest.raises(Exception):
+        test_func()
+    assert sum(delays) == pytest.approx(1.75)
+
+
 def test_serial_wrapper(caplog) -> None:
     """
     Test the serial wrapper.
@@ -91,10 +146,14 @@ def test_serial_wrapper(caplog) -> None:
     )
     assert str(serial_wrapper) == "<SerialWrapper 'loop://' '5678'>"
 
+    # Test that the serial port is requested with an exclusive lock
+    assert serial_wrapper.serial.exclusive
+
     # Test that the serial port is opened on the first message
     assert not serial_wrapper.serial.is_open
     assert serial_wrapper.query("Echo test") == "Echo test"
     assert serial_wrapper.serial.is_open
+    assert serial_wrapper.connection_count == 1
     assert caplog.record_tuples == [
         ('sbot.serial_wrapper', logging.INFO, 'Connected to board Test board:5678'),
         ('sbot.serial_wrapper', 5, "Serial write - 'Echo test'"),
@@ -102,9 +161,40 @@ def test_serial_wrapper(caplog) -> None:
     ]
 
     # Test that an exception is raised if a NACK is received
-    with pytest.raises(RuntimeError, match="Test exception"):
+    with pytest.raises(BoardNACKError, match="Test exception"):
         serial_wrapper.write("NACK:Test exception")
 
+    # Test that a NACK without a message is still an error
+    with pytest.raises(BoardNACKError, match="^$"):
+        serial_wrapper.query("NACK")
+
+    # Test that a write without a NACK response succeeds
+    serial_wrapper.write("ACK")
+
+
+def test_serial_wrapper_write_invalid_response(monkeypatch) -> None:
+    """Test that an invalid response to a write is retried and then raised."""
+    monkeypatch.setattr('sbot.serial_wrapper.time.sleep', lambda delay: None)
+    serial_wrapper = SerialWrapper(port='loop://', baud=115200)
+    transactions = []
+
+    def invalid_transact(data: str) -> bytes:
+        transactions.append(data)
+        return b'\xff'
+
+    monkeypatch.setattr(serial_wrapper, '_transact', invalid_transact)
+
+    # The response is checked regardless of the logging level
+    logging.getLogger('sbot.serial_wrapper').setLevel(logging.INFO)
+    try:
+        with pytest.raises(UnicodeDecodeError):
+            serial_wrapper.write("ACK")
+    finally:
+        logging.getLogger('sbot.serial_wrapper').setLevel(logging.NOTSET)
+
+    # 4 attempts for 3 retries
+    assert transactions == ["ACK"] * 4
+
 
 def test_serial_wrapper_invalid_port() -> None:
     """
@@ -136,7 +226,7 @@ def test_serial_wrapper_message_timeout(caplog, monkeypatch) -> None:
     assert serial_wrapper.query("Echo test") == "Echo test"
     caplog.clear()
 
-    monkeypatch.setattr(serial_wrapper.serial, 'readline', lambda: b'')
+    monkeypatch.setattr(serial_wrapper.serial, 'read', lambda size=1: b'')
     with pytest.raises(
         BoardDisconnectionError,
         match="Board : disconnected during transaction"
@@ -171,3 +261,209 @@ def test_serial_wrapper_message_timeout(caplog, monkeypatch) -> None:
          'Connection to board : timed out waiting for response'),
         ('sbot.serial_wrapper', logging.WARNING, 'Board : disconnected'),
     ]
+
+
+def test_serial_wrapper_readline() -> None:
+    """
+    Test that a whole response is read at once and trailing stale data is discarded.
+    """
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+    )
+    serial_wrapper.start()
+
+    serial_wrapper.serial.write(b'Echo test\nStale data\n')
+    assert serial_wrapper._readline() == b'Echo test'
+    assert serial_wrapper.serial.in_waiting == 0
+
+    # The response buffer is reused, so earlier responses must not leak into later ones
+    serial_wrapper.serial.write(b'Echo\n')
+    assert serial_wrapper._readline() == b'Echo'
+
+
+def test_serial_wrapper_query_multi() -> None:
+    """Test that several commands can be sent in a single transaction."""
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+    )
+
+    assert serial_wrapper.query_multi(
+        ["Echo test 0", "Echo test 1", "Echo test 2"]
+    ) == ["Echo test 0", "Echo test 1", "Echo test 2"]
+    assert serial_wrapper.query_multi([]) == []
+
+    # Test that a NACK to any command raises an error after all responses are read
+    with pytest.raises(RuntimeError, match="Test exception"):
+        serial_wrapper.query_multi(["Echo test", "NACK:Test exception", "Echo test"])
+    assert serial_wrapper.serial.in_waiting == 0
+
+
+def test_serial_wrapper_readlines() -> None:
+    """Test that several responses can be read when they don't all fit in the buffer."""
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+        max_response_len=16,
+    )
+    serial_wrapper.start()
+
+    serial_wrapper.serial.write(b'Echo test 0\nEcho test 1\nEcho test 2\nStale\n')
+    assert serial_wrapper._readlines(3) == [b'Echo test 0', b'Echo test 1', b'Echo test 2']
+
+
+def test_serial_wrapper_delay_after_connect() -> None:
+    """Test that the delay after connecting only holds back the first message."""
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+        delay_after_connect=0.2,
+    )
+
+    start = time.monotonic()
+    serial_wrapper.start()
+    assert time.monotonic() - start < 0.1
+
+    assert serial_wrapper.query("Echo test") == "Echo test"
+    assert time.monotonic() - start >= 0.2
+
+
+def test_serial_wrapper_invalid_command() -> None:
+    """Test that commands containing a newline are rejected before being sent."""
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+    )
+
+    with pytest.raises(ValueError, match="Command contains a newline"):
+        serial_wrapper.query("Echo\ntest")
+
+
+def test_serial_wrapper_response_too_long() -> None:
+    """Test that reading stops if a response is longer than the maximum length."""
+    serial_wrapper = SerialWrapper(
+        port='loop://',
+        baud=115200,
+        max_response_len=8,
+    )
+    serial_wrapper.start()
+
+    serial_wrapper.serial.write(b'Echo test\n')
+    with pytest.raises(SerialException, match="Response too long"):
+        serial_wrapper._readline()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Pseudo-terminals require a POSIX system")
+def test_serial_wrapper_fd() -> None:
+    """Test that a real serial port is read and written through its file descriptor."""
+    controller, device = os.openpty()
+    serial_wrapper = SerialWrapper(
+        port=os.ttyname(device),
+        baud=115200,
+    )
+    serial_wrapper.start()
+    assert serial_wrapper._fd == serial_wrapper.serial.fileno()
+
+    os.write(controller, b'Echo test\n')
+    assert serial_wrapper._readline() == b'Echo test'
+
+    serial_wrapper._write(b'Echo test\n')
+    assert os.read(controller, 64) == b'Echo test\n'
+
+    serial_wrapper._disconnect()
+    assert serial_wrapper._fd is None
+    os.close(controller)
+    os.close(device)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Pseudo-terminals require a POSIX system")
+def test_serial_wrapper_read_deadline() -> None:
+    """Test that the timeout applies to the whole response, not each read."""
+    controller, device = os.openpty()
+    serial_wrapper = SerialWrapper(
+        port=os.ttyname(device),
+        baud=115200,
+        timeout=0.2,
+    )
+    serial_wrapper.start()
+
+    def trickle() -> None:
+        """Send a partial response a byte at a time."""
+        for _ in range(20):
+            os.write(controller, b'a')
+            time.sleep(0.05)
+
+    trickle_thread = threading.Thread(target=trickle)
+    trickle_thread.start()
+    start = time.monotonic()
+    with pytest.raises(SerialException, match="Timeout on readline"):
+        serial_wrapper._readline()
+    assert time.monotonic() - start < 0.5
+
+    trickle_thread.join()
+    serial_wrapper._disconnect()
+    os.close(controller)
+    os.close(device)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Pseudo-terminals require a POSIX system")
+def test_serial_wrapper_low_latency_unsupported(monkeypatch) -> None:
+    """Test that low latency mode is only requested on Linux."""
+    def unsupported(self, low_latency_settings: bool) -> None:
+        raise NotImplementedError('Low latency not supported on this platform')
+
+    monkeypatch.setattr('sbot.serial_wrapper.sys.platform', 'darwin')
+    monkeypatch.setattr(
+        'sbot.serial_wrapper.serial.Serial.set_low_latency_mode', unsupported)
+    controller, device = os.openpty()
+    serial_wrapper = SerialWrapper(
+        port=os.ttyname(device),
+        baud=115200,
+    )
+    serial_wrapper.start()
+    assert serial_wrapper.serial.is_open
+
+    serial_wrapper._disconnect()
+    os.close(controller)
+    os.close(device)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Pseudo-terminals require a POSIX system")
+def test_serial_wrapper_connect_setup_failure(caplog, monkeypatch) -> None:
+    """Test that the port is closed if setting it up after opening fails."""
+    def setup_failure(self) -> None:
+        raise OSError('Setup failed')
+
+    monkeypatch.setattr(SerialWrapper, '_enable_low_latency', setup_failure)
+    controller, device = os.openpty()
+    serial_wrapper = SerialWrapper(
+        port=os.ttyname(device),
+        baud=115200,
+    )
+
+    assert not serial_wrapper._connect()
+    assert not serial_wrapper.serial.is_open
+    assert serial_wrapper._fd is None
+    assert serial_wrapper.connection_count == 0
+    assert 'Failed to connect to board' in caplog.text
+
+    os.close(controller)
+    os.close(device)
+
+
+def test_serial_wrapper_socket_nodelay() -> None:
+    """Test that socket connections disable Nagle's algorithm."""
+    with socket.create_server(('localhost', 0)) as server:
+        port = server.getsockname()[1]
+        serial_wrapper = SerialWrapper(
+            port=f'socket://localhost:{port}',
+            baud=115200,
+        )
+        serial_wrapper.start()
+
+        with socket.fromfd(
+            serial_wrapper.serial.fileno(), socket.AF_INET, socket.SOCK_STREAM,
+        ) as sock:
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        serial_wrapper.stop()
@@ -96,6 +96,20 @@ def test_servo_board(servoboard_serial: MockServoBoard) -> None:
     assert servo_board.voltage == 5.432
 
 
+def test_servo_board_telemetry(servoboard_serial: MockServoBoard) -> None:
+    """
+    Test that the current, voltage and status can be read at once.
+    """
+    servo_board = servoboard_serial.servo_board
+    servoboard_serial.serial_wrapper._add_responses([
+        ("SERVO:I?", "1234"),
+        ("SERVO:V?", "5432"),
+        ("*STATUS?", "0:1"),
+    ])
+
+    assert servo_board.telemetry() == (1.234, 5.432, (False, True))
+
+
 def test_servo_board_servos(servoboard_serial: MockServoBoard) -> None:
     """
     Test that the servo board servo functionality works.
@@ -142,6 +156,78 @@ def test_servo_board_servos(servoboard_serial: MockServoBoard) -> None:
     assert servo_board.servos[1].position is None
 
 
+def test_servo_board_set_positions(servoboard_serial: MockServoBoard) -> None:
+    """
+    Test that the positions of several servos can be set at once.
+    """
+    servo_board = servoboard_serial.servo_board
+    servoboard_serial.serial_wrapper._add_responses([
+        ("SERVO:0:SET:1050", "ACK"),
+        ("SERVO:1:SET:1500", "ACK"),
+        ("SERVO:2:DISABLE", "ACK"),
+    ])
+    servo_board.servos[0].set_duty_limits(1000, 1100)
+    servo_board.servos[1].set_duty_limits(1000, 2000)
+
+    servo_board.set_positions({0: 0, 1: 0, 2: None})
+
+    # Invalid values should be caught before any commands are sent
+    with pytest.raises(ValueError):
+        servo_board.set_positions({0: 0, 1: 1.1})
+    with pytest.raises(IndexError):
+        servo_board.set_positions({20: 0})
+    with pytest.raises(IndexError):
+        servo_board.set_positions({-1: 0})
+
+
+def test_servo_board_get_positions(servoboard_serial: MockServoBoard) -> None:
+    """
+    Test that the positions of all the servos can be read at once.
+    """
+    servo_board = servoboard_serial.servo_board
+    servoboard_serial.serial_wrapper._add_responses([
+        ("SERVO:0:GET?", "1025"),
+        ("SERVO:1:GET?", "1750"),
+        ("SERVO:2:GET?", "0"),
+        ("SERVO:3:GET?", "0"),
+        ("SERVO:4:GET?", "0"),
+        ("SERVO:5:GET?", "0"),
+        ("SERVO:6:GET?", "0"),
+        ("SERVO:7:GET?", "0"),
+    ])
+    servo_board.servos[0].set_duty_limits(1000, 1100)
+    servo_board.servos[1].set_duty_limits(1000, 2000)
+
+    assert servo_board.get_positions() == (-0.5, 0.5, None, None, None, None, None, None)
+
+
+def test_servo_board_repeated_position(servoboard_serial: MockServoBoard) -> None:
+    """
+    Test that setting a servo to its current position does not send a command.
+    """
+    servo_board = servoboard_serial.servo_board
+    serial_wrapper = servoboard_serial.serial_wrapper
+    serial_wrapper._add_responses([
+        ("SERVO:0:SET:1165", "ACK"),
+        ("*RESET", "ACK"),
+        ("SERVO:0:SET:1165", "ACK"),
+        ("SERVO:0:SET:1165", "ACK"),
+        ("SERVO:1:SET:1165", "ACK"),
+    ])
+
+    servo_board.servos[0].position = 0
+    servo_board.servos[0].position = 0
+
+    # Test that the position is sent again after the board is reset
+    servo_board.reset()
+    servo_board.servos[0].position = 0
+
+    # Test that the position is sent again after the serial port is reopened
+    serial_wrapper.connection_count += 1
+    servo_board.set_positions({0: 0, 1: 0})
+    servo_board.set_positions({0: 0, 1: 0})
+
+
 def test_servo_board_bounds_checking(servoboard_serial: MockServoBoard) -> None:
     """
     Test that handling of out of bounds values is correct.